@@ -13,7 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
 import config
 from modules.whatsmyname.list_operations import checkUpdates
-from modules.core.username import verifyUsername
+from modules.core.username import verifyUsernames
 from modules.core.email import verifyEmail
 from modules.utils.userAgent import getRandomUserAgent
 from modules.export.file_operations import createSaveDirectory
@@ -24,6 +24,22 @@ from modules.utils.file_operations import isFile, getLinesFromFile
 from modules.utils.permute import Permute
 from dotenv import load_dotenv
 
+# Use a faster event loop implementation for the async fan-out when available
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+else:
+    try:
+        import winloop
+
+        winloop.install()
+    except ImportError:
+        pass
+
 load_dotenv()
 
 
@@ -112,6 +128,11 @@ def initiate():
     parser.add_argument(
         "--dump", action="store_true", help="Dump HTML content for found accounts."
     )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Check sites over HTTP/2 with TLS verification (requires httpx).",
+    )
     parser.add_argument("--proxy", help="Proxy to send HTTP requests though.")
     parser.add_argument(
         "--timeout",
@@ -144,6 +165,7 @@ def initiate():
     config.filter = args.filter
     config.no_nsfw = args.no_nsfw
     config.dump = args.dump
+    config.http2 = args.http2
     config.proxy = args.proxy
     config.verbose = args.verbose
     config.ai = args.ai
@@ -274,11 +296,13 @@ if __name__ == "__main__":
             config.console.print(
                 f":glasses: Successfully loaded {len(config.username)} usernames from permuting {elements}"
             )
+        # One shared session/connection pool across the whole batch
+        foundByUser = verifyUsernames(config.username, config)
         for user in config.username:
             config.currentUser = user
+            config.usernameFoundAccounts = foundByUser.get(user, [])
             if config.dump or config.csv or config.pdf or config.json:
                 createSaveDirectory(config)
-            verifyUsername(config.currentUser, config)
             if config.ai:
                 if len(config.usernameFoundAccounts) > 2:
                     from modules.ai.client import send_prompt
@@ -9,6 +9,10 @@ USERNAME_LIST_URL = (
 )
 USERNAME_LIST_FILENAME = "wmn-data.json"
 USERNAME_LIST_PATH = os.path.join(os.getcwd(), LIST_DIRECTORY, USERNAME_LIST_FILENAME)
+USERNAME_LIST_VALIDATORS_FILENAME = "wmn-data.validators.json"
+USERNAME_LIST_VALIDATORS_PATH = os.path.join(
+    os.getcwd(), LIST_DIRECTORY, USERNAME_LIST_VALIDATORS_FILENAME
+)
 USERNAME_METADATA_LIST_FILENAME = "wmn-metadata.json"
 USERNAME_METADATA_LIST_PATH = os.path.join(
     os.getcwd(), LIST_DIRECTORY, USERNAME_METADATA_LIST_FILENAME
@@ -2,7 +2,6 @@ import os
 from pathlib import Path
 from rich.markup import escape
 import time
-import aiohttp
 import asyncio
 import sys
 
@@ -11,9 +10,15 @@ sys.path.append(
 )
 
 from ..utils.filter import filterFoundAccounts, applyFilters
+from ..utils.matcher import MarkerMatcher, matchMarkers
 from ..utils.parse import extractMetadata
-from ..utils.http_client import do_async_request
-from ..whatsmyname.list_operations import readList
+from ..utils.http_client import (
+    do_async_request,
+    create_client_session,
+    close_client_session,
+    prewarm_dns,
+)
+from ..whatsmyname.list_operations import readList, buildSiteUrl
 from ..utils.input import processInput
 from ..utils.log import logError
 from ..export.dump import dumpContent
@@ -54,10 +59,11 @@ async def checkSite(
             return returnData
         try:
             if response:
-                if (site["e_string"] in response["content"]) and (
-                    site["e_code"] == response["status_code"]
-                ):
-                    if (site["m_string"] not in response["content"]) and (
+                eStringFound, mStringFound = matchMarkers(
+                    site, response["content"], getattr(config, "marker_matcher", None)
+                )
+                if eStringFound and (site["e_code"] == response["status_code"]):
+                    if (not mStringFound) and (
                         site["m_code"] != response["status_code"]
                     ):
                         returnData["status"] = "FOUND"
@@ -97,10 +103,16 @@ async def checkSite(
 from rich.text import Text
 from rich.live import Live
 
-async def fetchResults(email, config):
+async def fetchResults(email, config, session=None):
+    # Let tasks that finish synchronously skip a scheduler round-trip (3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     data = readList("email", config)
     originalEmail = email
-    async with aiohttp.ClientSession() as session:
+    ownSession = session is None
+    if ownSession:
+        session = create_client_session(config)
+    try:
         tasks = []
         semaphore = asyncio.Semaphore(config.max_concurrent_requests)
         total_sites = len(config.email_sites)
@@ -120,7 +132,7 @@ async def fetchResults(email, config):
             else:
                 email_processed = originalEmail
 
-            url = site["uri_check"].replace("{account}", email_processed)
+            url = buildSiteUrl(site, email_processed)
             data = site["data"].replace("{account}", email_processed) if site["data"] else None
             headers = site["headers"] if site["headers"] else None
 
@@ -137,15 +149,25 @@ async def fetchResults(email, config):
             completed += 1
             return result
 
-        tasks = [wrappedCheck(site) for site in config.email_sites]
+        await prewarm_dns(
+            session,
+            [buildSiteUrl(site, originalEmail) for site in config.email_sites],
+        )
+
+        # TaskGroup cancels the remaining checks cleanly if the consumer bails
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(wrappedCheck(site)) for site in config.email_sites]
 
-        with Live(render(), refresh_per_second=10, console=config.console) as live:
-            for coro in asyncio.as_completed(tasks):
-                result = await coro
-                results.append(result)
-                live.update(render())
+            with Live(render(), refresh_per_second=10, console=config.console) as live:
+                for coro in asyncio.as_completed(tasks):
+                    result = await coro
+                    results.append(result)
+                    live.update(render())
 
         return {"results": results, "email": originalEmail}
+    finally:
+        if ownSession:
+            await close_client_session(session)
 
 
 
@@ -155,6 +177,7 @@ def verifyEmail(email, config):
     data = readList("email", config)
     sitesToSearch = data["sites"]
     config.email_sites = applyFilters(sitesToSearch, config)
+    config.marker_matcher = MarkerMatcher(config.email_sites)
 
     start_time = time.time()
     results = asyncio.run(fetchResults(email, config))
@@ -6,8 +6,11 @@ profile links for various social media and online platforms.
 """
 
 import os
-import json
-from typing import Dict, Optional, List
+import orjson
+import pickle
+import hashlib
+from types import MappingProxyType
+from typing import Dict, Optional, List, Tuple
 import logging
 import sys
 
@@ -17,6 +20,93 @@ sys.path.append(
 
 import config
 
+# Built-in fallback maps, defined once per process and shared read-only
+# between instances; _load_default_platforms copies them per instance
+_DEFAULT_PLATFORMS = MappingProxyType({
+    "Bandcamp": "https://bandcamp.com/{}",
+    "Chess.com": "https://www.chess.com/member/{}",
+    "Codeforces": "https://codeforces.com/profile/{}",
+    "DeviantArt": "https://www.deviantart.com/{}",
+    "Disqus": "https://disqus.com/by/{}/",
+    "DockerHub": "https://hub.docker.com/u/{}",
+    "Eyeem": "https://www.eyeem.com/u/{}",
+    "GitLab": "https://gitlab.com/{}",
+    "Hacker News": "https://news.ycombinator.com/user?id={}",
+    "Hackerearth": "https://www.hackerearth.com/@{}",
+    "Imgur": "https://imgur.com/user/{}",
+    "Instructables": "https://www.instructables.com/member/{}",
+    "Keybase": "https://keybase.io/{}",
+    "Livejournal": "https://{}.livejournal.com",
+    "Patreon": "https://www.patreon.com/{}",
+    "Reddit": "https://www.reddit.com/user/{}",
+    "SoundCloud": "https://soundcloud.com/{}",
+    "Spotify": "https://open.spotify.com/user/{}",
+    "Steam": "https://steamcommunity.com/user/{}",
+    "Telegram": "https://t.me/{}",
+    "TikTok": "https://www.tiktok.com/@{}",
+    "Tumblr": "https://{}.tumblr.com",
+    "Trello": "https://trello.com/u/{}",
+    "Twitch": "https://www.twitch.tv/{}",
+    "Twitter": "https://twitter.com/{}",
+    "Vimeo": "https://vimeo.com/{}",
+    "YouTube": "https://www.youtube.com/{}",
+    "About.me": "https://about.me/{}",
+    "Academia.edu": "https://independent.academia.edu/{}",
+    "AngelList": "https://angel.co/{}",
+    "Behance": "https://www.behance.net/{}",
+    "Bitbucket": "https://bitbucket.org/{}",
+    "Blogger": "https://{}.blogspot.com",
+    "Codepen": "https://codepen.io/{}",
+    "Dribbble": "https://dribbble.com/{}",
+    "Etsy": "https://www.etsy.com/shop/{}",
+    "Facebook": "https://www.facebook.com/{}",
+    "Flickr": "https://www.flickr.com/people/{}",
+    "Freelancer": "https://www.freelancer.com/u/{}",
+    "Goodreads": "https://www.goodreads.com/user/show/{}",
+    "Instagram": "https://www.instagram.com/{}",
+    "Last.fm": "https://www.last.fm/user/{}",
+    "LinkedIn": "https://www.linkedin.com/in/{}",
+    "Medium": "https://medium.com/@{}",
+    "Pinterest": "https://www.pinterest.com/{}",
+    "Product Hunt": "https://www.producthunt.com/@{}",
+    "Quora": "https://www.quora.com/profile/{}",
+    "ResearchGate": "https://www.researchgate.net/profile/{}",
+    "Snapchat": "https://www.snapchat.com/add/{}",
+    "TripAdvisor": "https://www.tripadvisor.com/members/{}",
+    "VK": "https://vk.com/{}",
+    "Wikipedia": "https://en.wikipedia.org/wiki/User:{}",
+    "Duolingo": "https://www.duolingo.com/profile/{}",
+    "smule": "https://www.smule.com/{}",
+    "TryHackMe": "https://tryhackme.com/p/{}",
+    "Hackerrank": "https://www.hackerrank.com/{}",
+    "lichess.org": "https://lichess.org/@/{}",
+})
+
+_DEFAULT_CATEGORIES = MappingProxyType({
+    "social": (
+        "Facebook", "Twitter", "Instagram", "LinkedIn", "Pinterest",
+        "Snapchat", "TikTok", "Reddit", "Tumblr", "VK",
+    ),
+    "professional": (
+        "LinkedIn", "GitHub", "GitLab", "Bitbucket", "DockerHub",
+        "Behance", "Dribbble", "Freelancer", "AngelList", "Product Hunt",
+    ),
+    "creative": (
+        "DeviantArt", "Behance", "Dribbble", "SoundCloud", "Bandcamp",
+        "YouTube", "Vimeo", "Flickr", "Etsy", "Medium",
+    ),
+    "gaming": (
+        "Steam", "Twitch", "Chess.com", "lichess.org", "TryHackMe",
+    ),
+    "tech": (
+        "GitHub", "GitLab", "Bitbucket", "DockerHub", "Codeforces",
+        "Hackerrank", "Hackerearth", "Hacker News", "Codepen",
+    ),
+    "education": (
+        "Academia.edu", "ResearchGate", "Duolingo", "Quora",
+    ),
+})
+
 
 class PlatformURLManager:
     """
@@ -34,8 +124,14 @@ class PlatformURLManager:
             config_path: Path to the platform URLs configuration file.
                          If None, uses the default path.
         """
-        self.platforms = {}
-        self.categories = {}
+        self._platforms = None
+        self._categories = None
+        self._compiled = {}
+        self._platform_to_cats = {}
+        self._raw_config = None
+        self._config_path = None
+        self._config_mtime = None
+        self._saved_hash = None
 
         # Default config path is in the data directory
         if config_path is None:
@@ -43,19 +139,34 @@ class PlatformURLManager:
 
         self.load_platforms(config_path)
 
+    @property
+    def platforms(self) -> Dict[str, str]:
+        self._ensure_loaded()
+        return self._platforms
+
+    @property
+    def categories(self) -> Dict[str, set]:
+        self._ensure_loaded()
+        return self._categories
+
     def load_platforms(self, config_path: str) -> None:
         """
         Load platform URLs from a configuration file.
 
+        The raw file is read here, but the JSON parse is deferred until the
+        platform data is first accessed.
+
         Args:
             config_path: Path to the configuration file.
         """
+        self._config_path = config_path
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.platforms = data.get('platforms', {})
-                    self.categories = data.get('categories', {})
+                self._config_mtime = os.path.getmtime(config_path)
+                with open(config_path, 'rb') as f:
+                    self._raw_config = f.read()
+                self._platforms = None
+                self._categories = None
             else:
                 # If the file doesn't exist, use the default hardcoded map
                 self._load_default_platforms()
@@ -65,93 +176,104 @@ class PlatformURLManager:
             logging.error(f"Error loading platform URLs: {str(e)}")
             self._load_default_platforms()
 
+    def _ensure_loaded(self) -> None:
+        """Parse the deferred configuration on first access."""
+        if self._platforms is not None:
+            return
+        if self._load_cache():
+            self._raw_config = None
+            return
+        try:
+            data = orjson.loads(self._raw_config)
+            self._platforms = data.get('platforms', {})
+            self._categories = data.get('categories', {})
+            self._compile_templates()
+            self._index_categories()
+            self._save_cache()
+        except Exception as e:
+            logging.error(f"Error loading platform URLs: {str(e)}")
+            self._load_default_platforms()
+        finally:
+            self._raw_config = None
+
+    def _cache_path(self) -> Optional[str]:
+        if self._config_path is None:
+            return None
+        return self._config_path + ".cache.pkl"
+
+    def _load_cache(self) -> bool:
+        """Load the precomputed index from the pickle sidecar, if still fresh."""
+        cache_path = self._cache_path()
+        if cache_path is None or self._config_mtime is None:
+            return False
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            mtime, platforms, categories, compiled, platform_to_cats = cached
+        except (OSError, pickle.PickleError, ValueError, EOFError):
+            return False
+        if mtime != self._config_mtime:
+            return False
+        self._platforms = platforms
+        self._categories = categories
+        self._compiled = compiled
+        self._platform_to_cats = platform_to_cats
+        return True
+
+    def _save_cache(self) -> None:
+        """Persist the parsed config and precomputed index next to the file."""
+        cache_path = self._cache_path()
+        if cache_path is None or self._config_mtime is None:
+            return
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(
+                    (
+                        self._config_mtime,
+                        self._platforms,
+                        self._categories,
+                        self._compiled,
+                        self._platform_to_cats,
+                    ),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError as e:
+            logging.error(f"Error saving platform URLs cache: {str(e)}")
+
+    def _index_categories(self) -> None:
+        """Normalize category members to sets and build the reverse index."""
+        self._categories = {
+            category: set(platforms) for category, platforms in self._categories.items()
+        }
+        self._platform_to_cats = {}
+        for category, platforms in self._categories.items():
+            for platform_name in platforms:
+                self._platform_to_cats.setdefault(platform_name, set()).add(category)
+
+    def _compile_templates(self) -> None:
+        """Split every URL template into a (prefix, suffix) pair once."""
+        self._compiled = {}
+        for name, template in self._platforms.items():
+            compiled = self._compile_template(template)
+            if compiled:
+                self._compiled[name] = compiled
+
+    @staticmethod
+    def _compile_template(url_template: str) -> Optional[Tuple[str, str]]:
+        """Split a URL template on its {} placeholder, or None if it has none."""
+        prefix, placeholder, suffix = url_template.partition("{}")
+        if placeholder:
+            return (prefix, suffix)
+        return None
+
     def _load_default_platforms(self) -> None:
         """Load the default hardcoded platform URLs."""
-        self.platforms = {
-            "Bandcamp": "https://bandcamp.com/{}",
-            "Chess.com": "https://www.chess.com/member/{}",
-            "Codeforces": "https://codeforces.com/profile/{}",
-            "DeviantArt": "https://www.deviantart.com/{}",
-            "Disqus": "https://disqus.com/by/{}/",
-            "DockerHub": "https://hub.docker.com/u/{}",
-            "Eyeem": "https://www.eyeem.com/u/{}",
-            "GitLab": "https://gitlab.com/{}",
-            "Hacker News": "https://news.ycombinator.com/user?id={}",
-            "Hackerearth": "https://www.hackerearth.com/@{}",
-            "Imgur": "https://imgur.com/user/{}",
-            "Instructables": "https://www.instructables.com/member/{}",
-            "Keybase": "https://keybase.io/{}",
-            "Livejournal": "https://{}.livejournal.com",
-            "Patreon": "https://www.patreon.com/{}",
-            "Reddit": "https://www.reddit.com/user/{}",
-            "SoundCloud": "https://soundcloud.com/{}",
-            "Spotify": "https://open.spotify.com/user/{}",
-            "Steam": "https://steamcommunity.com/user/{}",
-            "Telegram": "https://t.me/{}",
-            "TikTok": "https://www.tiktok.com/@{}",
-            "Tumblr": "https://{}.tumblr.com",
-            "Trello": "https://trello.com/u/{}",
-            "Twitch": "https://www.twitch.tv/{}",
-            "Twitter": "https://twitter.com/{}",
-            "Vimeo": "https://vimeo.com/{}",
-            "YouTube": "https://www.youtube.com/{}",
-            "About.me": "https://about.me/{}",
-            "Academia.edu": "https://independent.academia.edu/{}",
-            "AngelList": "https://angel.co/{}",
-            "Behance": "https://www.behance.net/{}",
-            "Bitbucket": "https://bitbucket.org/{}",
-            "Blogger": "https://{}.blogspot.com",
-            "Codepen": "https://codepen.io/{}",
-            "Dribbble": "https://dribbble.com/{}",
-            "Etsy": "https://www.etsy.com/shop/{}",
-            "Facebook": "https://www.facebook.com/{}",
-            "Flickr": "https://www.flickr.com/people/{}",
-            "Freelancer": "https://www.freelancer.com/u/{}",
-            "Goodreads": "https://www.goodreads.com/user/show/{}",
-            "Instagram": "https://www.instagram.com/{}",
-            "Last.fm": "https://www.last.fm/user/{}",
-            "LinkedIn": "https://www.linkedin.com/in/{}",
-            "Medium": "https://medium.com/@{}",
-            "Pinterest": "https://www.pinterest.com/{}",
-            "Product Hunt": "https://www.producthunt.com/@{}",
-            "Quora": "https://www.quora.com/profile/{}",
-            "ResearchGate": "https://www.researchgate.net/profile/{}",
-            "Snapchat": "https://www.snapchat.com/add/{}",
-            "TripAdvisor": "https://www.tripadvisor.com/members/{}",
-            "VK": "https://vk.com/{}",
-            "Wikipedia": "https://en.wikipedia.org/wiki/User:{}",
-            "Duolingo": "https://www.duolingo.com/profile/{}",
-            "smule": "https://www.smule.com/{}",
-            "TryHackMe": "https://tryhackme.com/p/{}",
-            "Hackerrank": "https://www.hackerrank.com/{}",
-            "lichess.org": "https://lichess.org/@/{}",
-        }
+        self._platforms = dict(_DEFAULT_PLATFORMS)
+        self._categories = dict(_DEFAULT_CATEGORIES)
 
-        # Default categories
-        self.categories = {
-            "social": [
-                "Facebook", "Twitter", "Instagram", "LinkedIn", "Pinterest",
-                "Snapchat", "TikTok", "Reddit", "Tumblr", "VK"
-            ],
-            "professional": [
-                "LinkedIn", "GitHub", "GitLab", "Bitbucket", "DockerHub",
-                "Behance", "Dribbble", "Freelancer", "AngelList", "Product Hunt"
-            ],
-            "creative": [
-                "DeviantArt", "Behance", "Dribbble", "SoundCloud", "Bandcamp",
-                "YouTube", "Vimeo", "Flickr", "Etsy", "Medium"
-            ],
-            "gaming": [
-                "Steam", "Twitch", "Chess.com", "lichess.org", "TryHackMe"
-            ],
-            "tech": [
-                "GitHub", "GitLab", "Bitbucket", "DockerHub", "Codeforces",
-                "Hackerrank", "Hackerearth", "Hacker News", "Codepen"
-            ],
-            "education": [
-                "Academia.edu", "ResearchGate", "Duolingo", "Quora"
-            ]
-        }
+        self._compile_templates()
+        self._index_categories()
 
     def save_platforms(self, config_path: str) -> bool:
         """
@@ -169,11 +291,30 @@ class PlatformURLManager:
 
             data = {
                 'platforms': self.platforms,
-                'categories': self.categories
+                'categories': {
+                    category: sorted(platforms)
+                    for category, platforms in self.categories.items()
+                }
             }
 
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            serializedHash = hashlib.sha1(serialized).hexdigest()
+            if serializedHash == self._saved_hash and config_path == self._config_path:
+                # Content unchanged since the last save, skip the write
+                return True
+
+            # Write to a temp file and swap it in atomically, so a failed
+            # write can never leave a truncated config behind
+            tmp_path = config_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(serialized)
+            os.replace(tmp_path, config_path)
+            self._saved_hash = serializedHash
+
+            # Keep the pickle sidecar in sync with the rewritten config
+            self._config_path = config_path
+            self._config_mtime = os.path.getmtime(config_path)
+            self._save_cache()
             return True
         except Exception as e:
             logging.error(f"Error saving platform URLs: {str(e)}")
@@ -191,6 +332,14 @@ class PlatformURLManager:
         Returns:
             str: The generated profile URL.
         """
+        self._ensure_loaded()
+        compiled = self._compiled.get(platform_name)
+
+        if compiled:
+            # Plain concatenation, no per-call template parse
+            prefix, suffix = compiled
+            return prefix + username + suffix
+
         url_template = self.platforms.get(platform_name)
 
         if url_template:
@@ -210,14 +359,16 @@ class PlatformURLManager:
             categories: List of categories to add this platform to.
         """
         self.platforms[platform_name] = url_template
+        compiled = self._compile_template(url_template)
+        if compiled:
+            self._compiled[platform_name] = compiled
+        else:
+            self._compiled.pop(platform_name, None)
 
         if categories:
             for category in categories:
-                if category in self.categories:
-                    if platform_name not in self.categories[category]:
-                        self.categories[category].append(platform_name)
-                else:
-                    self.categories[category] = [platform_name]
+                self.categories.setdefault(category, set()).add(platform_name)
+                self._platform_to_cats.setdefault(platform_name, set()).add(category)
 
     def remove_platform(self, platform_name: str) -> bool:
         """
@@ -231,11 +382,11 @@ class PlatformURLManager:
         """
         if platform_name in self.platforms:
             del self.platforms[platform_name]
+            self._compiled.pop(platform_name, None)
 
-            # Also remove from categories
-            for category in self.categories:
-                if platform_name in self.categories[category]:
-                    self.categories[category].remove(platform_name)
+            # Only touch the categories the platform actually belongs to
+            for category in self._platform_to_cats.pop(platform_name, ()):
+                self.categories[category].discard(platform_name)
 
             return True
         return False
@@ -250,7 +401,7 @@ class PlatformURLManager:
         Returns:
             List[str]: List of platform names in the category.
         """
-        return self.categories.get(category, [])
+        return list(self.categories.get(category, ()))
 
     def get_all_platforms(self) -> Dict[str, str]:
         """
@@ -268,4 +419,15 @@ class PlatformURLManager:
         Returns:
             Dict[str, List[str]]: Dictionary of category names and platform lists.
         """
-        return self.categories
+        return {category: list(platforms) for category, platforms in self.categories.items()}
+
+
+_default_manager: Optional[PlatformURLManager] = None
+
+
+def get_platform_manager() -> PlatformURLManager:
+    """Return a process-wide PlatformURLManager for the default config."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = PlatformURLManager()
+    return _default_manager
@@ -1,7 +1,6 @@
 import sys
 import os
 import time
-import aiohttp
 import asyncio
 
 from rich.live import Live
@@ -13,14 +12,21 @@ sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 )
 
-from ..whatsmyname.list_operations import readList
+from ..whatsmyname.list_operations import readList, buildSiteUrl
 from ..utils.parse import extractMetadata, remove_duplicates
 from ..utils.filter import filterFoundAccounts, applyFilters
-from ..utils.http_client import do_async_request
+from ..utils.matcher import MarkerMatcher, matchMarkers
+from ..utils.http_client import (
+    do_async_request,
+    create_client_session,
+    close_client_session,
+    prewarm_dns,
+)
 from ..utils.log import logError
 from ..export.dump import dumpContent
+from ..export.file_operations import createSaveDirectory
 from ..sites.instagram import get_instagram_account_info
-from .platform_manager import PlatformURLManager
+from .platform_manager import get_platform_manager
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
@@ -50,10 +56,11 @@ async def checkSite(
             return returnData
         try:
             if response:
-                if (site["e_string"] in response["content"]) and (
-                    site["e_code"] == response["status_code"]
-                ):
-                    if (site["m_string"] not in response["content"]) and (
+                eStringFound, mStringFound = matchMarkers(
+                    site, response["content"], getattr(config, "marker_matcher", None)
+                )
+                if eStringFound and (site["e_code"] == response["status_code"]):
+                    if (not mStringFound) and (
                         (site["m_code"] != response["status_code"])
                         if site["m_code"] != site["e_code"]
                         else True
@@ -61,7 +68,7 @@ async def checkSite(
                         returnData["status"] = "FOUND"
                         # Use the PlatformURLManager to get the profile URL
                         if not hasattr(config, 'platform_manager'):
-                            config.platform_manager = PlatformURLManager()
+                            config.platform_manager = get_platform_manager()
                         profile_url = config.platform_manager.get_profile_url(site['name'], config.currentUser, response['url'])
                         config.console.print(f"✔️  \[[cyan1]{site['name']}[/cyan1]] [bright_white]{profile_url}[/bright_white]")
 
@@ -122,12 +129,18 @@ from rich.live import Live
 from rich.console import Group
 from rich.text import Text
 
-async def fetchResults(username, config):
-    async with aiohttp.ClientSession() as session:
+# Yield site check results one by one as they complete
+async def fetchResults(username, config, session=None):
+    # Let tasks that finish synchronously skip a scheduler round-trip (3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    ownSession = session is None
+    if ownSession:
+        session = create_client_session(config)
+    try:
         semaphore = asyncio.Semaphore(config.max_concurrent_requests)
         total_sites = len(config.username_sites)
         completed = 0
-        results = []
 
         def render():
             percent = int((completed / total_sites) * 100)
@@ -140,7 +153,7 @@ async def fetchResults(username, config):
             result = await checkSite(
                 site=site,
                 method="GET",
-                url=site["uri_check"].replace("{account}", username),
+                url=buildSiteUrl(site, username),
                 session=session,
                 semaphore=semaphore,
                 config=config,
@@ -148,24 +161,41 @@ async def fetchResults(username, config):
             completed += 1
             return result
 
-        tasks = [wrappedCheck(site) for site in config.username_sites]
-
-        with Live(render(), refresh_per_second=10, console=config.console) as live:
-            for coro in asyncio.as_completed(tasks):
-                result = await coro
-                results.append(result)
-                live.update(render())
+        await prewarm_dns(
+            session,
+            [buildSiteUrl(site, username) for site in config.username_sites],
+        )
 
-        return {"results": results, "username": username}
+        # Yielding inside a TaskGroup would turn an early consumer close
+        # into a BaseExceptionGroup, so manage the tasks directly and
+        # cancel whatever is still pending when the generator is closed
+        tasks = [
+            asyncio.create_task(wrappedCheck(site)) for site in config.username_sites
+        ]
+        try:
+            with Live(render(), refresh_per_second=10, console=config.console) as live:
+                for coro in asyncio.as_completed(tasks):
+                    result = await coro
+                    live.update(render())
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if ownSession:
+            await close_client_session(session)
 
 
 
 
-# Start username check and presents results to user
-def verifyUsername(username, config, sitesToSearch=None, metadata_params=None):
+# Async core of verifyUsername so batch runs can share one session
+async def _verifyUsername(
+    username, config, sitesToSearch=None, metadata_params=None, session=None
+):
     # Initialize the platform manager if it doesn't exist
     if not hasattr(config, 'platform_manager'):
-        config.platform_manager = PlatformURLManager()
+        config.platform_manager = get_platform_manager()
 
     if sitesToSearch is None or metadata_params is None:
         data = readList("username", config)
@@ -175,9 +205,13 @@ def verifyUsername(username, config, sitesToSearch=None, metadata_params=None):
         config.metadata_params = metadata_params
 
     config.username_sites = applyFilters(sitesToSearch, config)
+    config.marker_matcher = MarkerMatcher(config.username_sites)
 
     start_time = time.time()
-    results = asyncio.run(fetchResults(username, config))
+    # Consume results as they land instead of holding the full fan-out
+    results = []
+    async for result in fetchResults(username, config, session=session):
+        results.append(result)
     end_time = time.time()
 
     config.console.print(
@@ -190,9 +224,45 @@ def verifyUsername(username, config, sitesToSearch=None, metadata_params=None):
         )
 
     # Filter results to only found accounts
-    foundAccounts = list(filter(filterFoundAccounts, results["results"]))
+    foundAccounts = list(filter(filterFoundAccounts, results))
     config.usernameFoundAccounts = foundAccounts
     if len(foundAccounts) <= 0:
         config.console.print("⭕ No accounts were found for the given username")
 
     return foundAccounts
+
+
+# Check a batch of usernames over one shared session and connection pool
+async def verify_many(usernames, config):
+    data = readList("username", config)
+    metadata_params = readList("metadata", config)
+
+    foundByUser = {}
+    session = create_client_session(config)
+    try:
+        for username in usernames:
+            config.currentUser = username
+            if config.dump or config.csv or config.pdf or config.json:
+                createSaveDirectory(config)
+            foundByUser[username] = await _verifyUsername(
+                username,
+                config,
+                sitesToSearch=data["sites"],
+                metadata_params=metadata_params,
+                session=session,
+            )
+    finally:
+        await close_client_session(session)
+    return foundByUser
+
+
+# Run a batch check for several usernames, amortizing DNS/TLS across them
+def verifyUsernames(usernames, config):
+    return asyncio.run(verify_many(usernames, config))
+
+
+# Start username check and presents results to user
+def verifyUsername(username, config, sitesToSearch=None, metadata_params=None):
+    return asyncio.run(
+        _verifyUsername(username, config, sitesToSearch, metadata_params)
+    )
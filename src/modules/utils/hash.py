@@ -1,9 +1,18 @@
 import hashlib
-import json
+import orjson
 
 
 # Return MD5 HASH for given JSON
 def hashJSON(jsonData):
-    dumpJson = json.dumps(jsonData, sort_keys=True)
-    jsonHash = hashlib.md5(dumpJson.encode("utf-8")).hexdigest()
+    # orjson emits bytes directly, no intermediate str/encode step
+    jsonHash = hashlib.md5(orjson.dumps(jsonData, option=orjson.OPT_SORT_KEYS)).hexdigest()
     return jsonHash
+
+
+# Return MD5 HASH for a file, streamed in chunks
+def hashFile(filePath):
+    fileHash = hashlib.md5()
+    with open(filePath, "rb") as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b""):
+            fileHash.update(chunk)
+    return fileHash.hexdigest()
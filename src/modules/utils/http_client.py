@@ -1,7 +1,18 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 import os
+import json
+import asyncio
+import aiohttp
 import chardet
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "."))
 
@@ -9,9 +20,99 @@ from log import logError
 
 requests.packages.urllib3.disable_warnings()
 
+# Module-level session so sync requests reuse pooled connections instead
+# of re-doing the TCP/TLS handshake on every call
+_sync_session = requests.Session()
+_sync_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_sync_session.mount("http://", _sync_adapter)
+_sync_session.mount("https://", _sync_adapter)
+
+# Connection pool limits for the async client, overridable through the
+# environment for large WhatsMyName lists
+MAX_CONNECTIONS = int(os.environ.get("BLACKBIRD_MAX_CONNECTIONS", 512))
+MAX_CONNECTIONS_PER_HOST = int(os.environ.get("BLACKBIRD_MAX_CONNECTIONS_PER_HOST", 4))
+DNS_CACHE_TTL = 300
+
+
+def _create_resolver():
+    # AsyncResolver resolves through aiodns/c-ares off the event loop thread;
+    # fall back to the default threaded resolver when aiodns is unavailable
+    try:
+        return aiohttp.AsyncResolver()
+    except RuntimeError:
+        return aiohttp.ThreadedResolver()
+
+
+# Create an async HTTP client backed by a bounded connection pool. With
+# --http2 (and httpx installed) requests multiplex over HTTP/2 with TLS
+# verification on; otherwise the aiohttp session matches legacy behavior.
+def create_client_session(config, http2=None):
+    if http2 is None:
+        http2 = getattr(config, "http2", False)
+    if http2 and httpx is not None:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS // 2,
+            ),
+            timeout=config.timeout,
+            verify=True,
+            proxy=config.proxy if config.proxy else None,
+            follow_redirects=True,
+        )
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        enable_cleanup_closed=True,
+        resolver=_create_resolver(),
+    )
+    timeout = aiohttp.ClientTimeout(total=config.timeout)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+# Close either flavor of async client
+async def close_client_session(session):
+    if hasattr(session, "aclose"):
+        await session.aclose()
+    else:
+        await session.close()
+
+
+# Resolve every unique hostname once up front so the connector's DNS cache
+# is already hot when the site fan-out starts
+async def prewarm_dns(session, urls):
+    connector = getattr(session, "connector", None)
+    if connector is None:
+        return
+    resolveHost = getattr(connector, "_resolve_host", None)
+    if resolveHost is None:
+        return
+    # The connector's DNS cache is keyed by (host, port), so the port has
+    # to match what the real request will use
+    endpoints = set()
+    for url in urls:
+        parts = urlsplit(url)
+        if parts.hostname is None:
+            continue
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        endpoints.add((parts.hostname, port))
+    await asyncio.gather(
+        *(resolveHost(host, port) for host, port in endpoints),
+        return_exceptions=True,
+    )
+
 
 # Perform a Sync Request and return response details
-def do_sync_request(method, url, config, data=None, customHeaders=None, cookies=None):
+def do_sync_request(
+    method, url, config, data=None, customHeaders=None, cookies=None, stream=False
+):
     headers = {"User-Agent": config.userAgent}
     if customHeaders:
         headers.update(customHeaders)
@@ -24,13 +125,14 @@ def do_sync_request(method, url, config, data=None, customHeaders=None, cookies=
         "headers": headers,
         "data": data,
         "cookies": cookies,
+        "stream": stream,
     }
     
     # Only add proxies parameter if a proxy is actually configured
     if config.proxy:
         request_kwargs["proxies"] = {"http": config.proxy, "https": config.proxy}
     try:
-        response = requests.request(**request_kwargs)
+        response = _sync_session.request(**request_kwargs)
         if config.verbose:
             config.console.print(
                 f"  🆗 Sync HTTP Request completed [{method} - {response.status_code}] {url}"
@@ -50,7 +152,38 @@ async def do_async_request(method, url, session, config, data=None, customHeader
         headers.update(customHeaders)
     proxy = config.proxy if config.proxy else None
     try:
-        response = await session.request(
+        if httpx is not None and isinstance(session, httpx.AsyncClient):
+            # HTTP/2 path: proxy/redirect/TLS policy live on the client
+            async with asyncio.timeout(config.timeout):
+                response = await session.request(
+                    method, url, content=data, headers=headers
+                )
+                content = "" if method.upper() == "HEAD" else response.text
+
+                jsonData = None
+                if "application/json" in response.headers.get("Content-Type", ""):
+                    try:
+                        jsonData = json.loads(content)
+                    except ValueError:
+                        pass
+
+                responseData = {
+                    "url": url,
+                    "status_code": response.status_code,
+                    "headers": response.headers,
+                    "content": content,
+                    "json": jsonData,
+                }
+
+            if config.verbose:
+                config.console.print(
+                    f"  🆗 Async HTTP Request completed [{method} - {responseData['status_code']}] {url}"
+                )
+            return responseData
+
+        # Hard deadline covering connect, redirects and the body read, so a
+        # single hanging site can't stall the whole fan-out
+        async with asyncio.timeout(config.timeout), session.request(
             method,
             url,
             proxy=proxy,
@@ -60,31 +193,36 @@ async def do_async_request(method, url, session, config, data=None, customHeader
             data=data,
             headers=headers,
             max_redirects=10,
-        )
+        ) as response:
+            # HEAD probes only need the status line and headers
+            if method.upper() == "HEAD":
+                content = ""
+            else:
+                binaryContent = await response.read()
+                try:
+                    content = binaryContent.decode(response.get_encoding())
+                except (LookupError, UnicodeDecodeError):
+                    encode = chardet.detect(binaryContent)["encoding"]
+                    content = binaryContent.decode(encode or "utf-8", errors="replace")
+
+            jsonData = None
+            if "application/json" in response.headers.get("Content-Type", ""):
+                try:
+                    jsonData = json.loads(content)
+                except ValueError:
+                    pass
 
-        json = None
-        try:
-            content = await response.text()
-        except:
-            binaryContent = await response.read()
-            encode = chardet.detect(binaryContent)["encoding"]
-            content = binaryContent.decode(encode)
-
-        if "Content-Type" in response.headers:
-            if "application/json" in response.headers["Content-Type"]:
-                json = await response.json()
-
-        responseData = {
-            "url": url,
-            "status_code": response.status,
-            "headers": response.headers,
-            "content": content,
-            "json": json,
-        }
+            responseData = {
+                "url": url,
+                "status_code": response.status,
+                "headers": response.headers,
+                "content": content,
+                "json": jsonData,
+            }
 
         if config.verbose:
             config.console.print(
-                f"  🆗 Async HTTP Request completed [{method} - {response.status}] {url}"
+                f"  🆗 Async HTTP Request completed [{method} - {responseData['status_code']}] {url}"
             )
         return responseData
     except Exception as e:
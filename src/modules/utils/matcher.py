@@ -0,0 +1,44 @@
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Multi-pattern matcher for the e_string/m_string markers of a site list
+class MarkerMatcher:
+    """
+    Compiles every existence/absence marker from a site list into a single
+    Aho-Corasick automaton, so one pass over a response body finds all
+    markers it contains instead of one substring scan per marker.
+    Falls back to plain substring checks when pyahocorasick is missing.
+    """
+
+    def __init__(self, sites):
+        self._automaton = None
+        if ahocorasick is None:
+            return
+        automaton = ahocorasick.Automaton()
+        for site in sites:
+            for marker in (site.get("e_string"), site.get("m_string")):
+                if marker:
+                    automaton.add_word(marker, marker)
+        if len(automaton) > 0:
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @property
+    def available(self):
+        return self._automaton is not None
+
+    # Return the set of marker strings present in content, in a single pass
+    def find_markers(self, content):
+        return {marker for _, marker in self._automaton.iter(content)}
+
+
+# Check a site's markers against a response body, via the compiled automaton
+# when available and plain substring scans otherwise
+def matchMarkers(site, content, matcher=None):
+    if matcher is not None and matcher.available:
+        markers = matcher.find_markers(content)
+        return (site["e_string"] in markers, site["m_string"] in markers)
+    return (site["e_string"] in content, site["m_string"] in content)
@@ -1,59 +1,168 @@
 import os
 import sys
-import json
+import orjson
+import asyncio
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 
-from utils.http_client import do_sync_request
-from utils.hash import hashJSON
+import hashlib
+
+from utils.http_client import create_client_session
+from utils.hash import hashFile
 from utils.log import logError
 
 
+# Split each site's uri_check template once, so building URLs in the check
+# fan-out is plain concatenation instead of a str.replace per site
+def compileUriTemplates(sites):
+    for site in sites:
+        template = site.get("uri_check", "")
+        if template.count("{account}") == 1:
+            site["_uri_prefix"], site["_uri_suffix"] = template.split("{account}", 1)
+    return sites
+
+
+# Build a site's check URL from the precompiled template parts
+def buildSiteUrl(site, account):
+    try:
+        return site["_uri_prefix"] + account + site["_uri_suffix"]
+    except KeyError:
+        return site["uri_check"].replace("{account}", account)
+
+
 # Read list file and return content
 def readList(option, config):
     if option == "username":
-        with open(config.USERNAME_LIST_PATH, "r", encoding="UTF-8") as f:
-            data = json.load(f)
+        with open(config.USERNAME_LIST_PATH, "rb") as f:
+            data = orjson.loads(f.read())
+        compileUriTemplates(data.get("sites", []))
         return data
     elif option == "email":
-        with open(config.EMAIL_LIST_PATH, "r", encoding="UTF-8") as f:
-            data = json.load(f)
+        with open(config.EMAIL_LIST_PATH, "rb") as f:
+            data = orjson.loads(f.read())
+        compileUriTemplates(data.get("sites", []))
         return data
     elif option == "metadata":
-        with open(config.USERNAME_METADATA_LIST_PATH, "r", encoding="UTF-8") as f:
-            data = json.load(f)
+        with open(config.USERNAME_METADATA_LIST_PATH, "rb") as f:
+            data = orjson.loads(f.read())
         return data
     else:
         return False
 
 
+# Read cached HTTP validators (ETag / Last-Modified) for the remote list
+def readListValidators(config):
+    try:
+        with open(config.USERNAME_LIST_VALIDATORS_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+# Persist HTTP validators returned with the remote list
+def saveListValidators(response, config):
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    try:
+        with open(config.USERNAME_LIST_VALIDATORS_PATH, "wb") as f:
+            f.write(orjson.dumps(validators))
+    except OSError as e:
+        logError(e, "Coudn't save list validators", config)
+
+
+# Stream the remote list straight to disk over the shared async client
+async def _downloadList(config, session):
+    headers = {"User-Agent": config.userAgent}
+    proxy = config.proxy if config.proxy else None
+    async with session.get(
+        config.USERNAME_LIST_URL, headers=headers, proxy=proxy, ssl=False
+    ) as response:
+        # Never write an error body over the list path
+        response.raise_for_status()
+        with open(config.USERNAME_LIST_PATH, "wb") as f:
+            async for chunk in response.content.iter_chunked(65536):
+                f.write(chunk)
+        saveListValidators(response, config)
+
+
+# Compare remote list against the local one and rewrite it when changed
+async def _checkUpdates(config, session):
+    headers = {"User-Agent": config.userAgent}
+    validators = readListValidators(config)
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    proxy = config.proxy if config.proxy else None
+
+    async with session.get(
+        config.USERNAME_LIST_URL, headers=headers, proxy=proxy, ssl=False
+    ) as response:
+        if response.status == 304:
+            config.console.print("✔️  Sites List is up to date")
+            return
+        # Anything but a 200 must not replace the known-good local list;
+        # raising lands in checkUpdates' existing fallback path
+        response.raise_for_status()
+
+        # No conditional support: hash the local file in a worker thread
+        # while the remote stream is downloaded and hashed, so wall time is
+        # max(network, hash) instead of their sum
+        localHashFuture = asyncio.get_running_loop().run_in_executor(
+            None, hashFile, config.USERNAME_LIST_PATH
+        )
+
+        remoteListHash = hashlib.md5()
+        tmpPath = config.USERNAME_LIST_PATH + ".tmp"
+        with open(tmpPath, "wb") as f:
+            async for chunk in response.content.iter_chunked(65536):
+                remoteListHash.update(chunk)
+                f.write(chunk)
+
+        if await localHashFuture != remoteListHash.hexdigest():
+            config.console.print(":counterclockwise_arrows_button: Updating...")
+            os.replace(tmpPath, config.USERNAME_LIST_PATH)
+        else:
+            os.remove(tmpPath)
+            config.console.print("✔️  Sites List is up to date")
+        saveListValidators(response, config)
+
+
 # Download .JSON file list from defined URL
 def downloadList(config):
-    response = do_sync_request("GET", config.USERNAME_LIST_URL, config)
-    with open(config.USERNAME_LIST_PATH, "w", encoding="UTF-8") as f:
-        json.dump(response.json(), f, indent=4, ensure_ascii=False)
+    async def run():
+        session = create_client_session(config, http2=False)
+        try:
+            await _downloadList(config, session)
+        finally:
+            await session.close()
+
+    asyncio.run(run())
 
 
 # Check for changes in remote list
 def checkUpdates(config):
-    if os.path.isfile(config.USERNAME_LIST_PATH):
-        config.console.print(":counterclockwise_arrows_button: Checking for updates...")
+    async def run():
+        session = create_client_session(config, http2=False)
         try:
-            data = readList("username", config)
-            currentListHash = hashJSON(data)
-            response = do_sync_request("GET", config.USERNAME_LIST_URL, config)
-            remoteListHash = hashJSON(response.json())
-            if currentListHash != remoteListHash:
-                config.console.print(":counterclockwise_arrows_button: Updating...")
-                downloadList(config)
+            if os.path.isfile(config.USERNAME_LIST_PATH):
+                config.console.print(
+                    ":counterclockwise_arrows_button: Checking for updates..."
+                )
+                try:
+                    await _checkUpdates(config, session)
+                except Exception as e:
+                    config.console.print(":police_car_light: Coudn't read local list")
+                    config.console.print(":down_arrow: Downloading site list")
+                    logError(e, f"Coudn't read local list", config)
+                    await _downloadList(config, session)
             else:
-                config.console.print("✔️  Sites List is up to date")
-        except Exception as e:
-            config.console.print(":police_car_light: Coudn't read local list")
-            config.console.print(":down_arrow: Downloading site list")
-            logError(e, f"Coudn't read local list", config)
-            downloadList(config)
-    else:
-        config.console.print(":globe_with_meridians: Downloading site list")
-        downloadList(config)
+                config.console.print(":globe_with_meridians: Downloading site list")
+                await _downloadList(config, session)
+        finally:
+            await session.close()
+
+    asyncio.run(run())
@@ -1,5 +1,6 @@
 import sys
 import os
+import copy
 import unittest
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -8,8 +9,14 @@ from src.modules.core.platform_manager import PlatformURLManager
 
 
 class TestPlatformURLManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Load and parse the config once for the whole class
+        cls._base_manager = PlatformURLManager()
+
     def setUp(self):
-        self.manager = PlatformURLManager()
+        # Each test mutates an in-memory copy instead of re-reading from disk
+        self.manager = copy.deepcopy(self._base_manager)
     
     def test_get_profile_url(self):
         # Test with existing platform